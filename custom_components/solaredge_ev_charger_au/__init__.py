@@ -1,10 +1,28 @@
+import voluptuous as vol
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall, ServiceResponse, SupportsResponse
 from homeassistant.helpers import config_validation as cv
 from homeassistant.const import Platform
 
-from .const import DOMAIN, CONF_HOST, CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+from .const import (
+    DOMAIN,
+    CONF_HOST,
+    CONF_SCAN_INTERVAL,
+    CONF_MQTT_TOPIC,
+    CONF_GRID_SENSOR,
+    CONF_MAX_CURRENT,
+    CONF_PHASES,
+    DEFAULT_SCAN_INTERVAL,
+    DEFAULT_MQTT_TOPIC,
+    DEFAULT_GRID_SENSOR,
+    DEFAULT_MAX_CURRENT,
+    DEFAULT_LM_PHASES,
+    SESSION_DB_FILE,
+    SERVICE_QUERY_SESSIONS,
+)
 from .coordinator import SolarEdgeEVChargerAUDataUpdateCoordinator
+from .publisher import SolarEdgeEVChargerAUPublisher
+from .session_store import SessionStore, GROUP_BY_NONE, GROUP_BY_DAY, GROUP_BY_MONTH
 
 PLATFORMS: list[str] = [
     Platform.SENSOR
@@ -12,25 +30,70 @@ PLATFORMS: list[str] = [
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+QUERY_SESSIONS_SCHEMA = vol.Schema({
+    vol.Optional("start"): cv.datetime,
+    vol.Optional("end"): cv.datetime,
+    vol.Optional("group_by", default=GROUP_BY_NONE): vol.In(
+        [GROUP_BY_NONE, GROUP_BY_DAY, GROUP_BY_MONTH]
+    ),
+    vol.Optional("config_entry_id"): cv.string,
+})
+
 async def async_setup(hass: HomeAssistant, config: dict):
-    """For YAML-based setups (unused)."""
+    """Register integration-wide services."""
+
+    async def async_query_sessions(call: ServiceCall) -> ServiceResponse:
+        """Return stored charging sessions or per-day/month aggregates."""
+        store = SessionStore(hass, hass.config.path(SESSION_DB_FILE))
+        results = await store.async_query(
+            call.data.get("start"),
+            call.data.get("end"),
+            call.data["group_by"],
+            call.data.get("config_entry_id"),
+        )
+        return {"sessions" if call.data["group_by"] == GROUP_BY_NONE else "periods": results}
+
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_QUERY_SESSIONS,
+        async_query_sessions,
+        schema=QUERY_SESSIONS_SCHEMA,
+        supports_response=SupportsResponse.ONLY,
+    )
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Create and set up a config entry (integration instance)."""
 
+    session_store = SessionStore(hass, hass.config.path(SESSION_DB_FILE))
+    await session_store.async_setup()
+
     coordinator = SolarEdgeEVChargerAUDataUpdateCoordinator(
         hass,
         entry.data[CONF_HOST],
-        entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+        entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
+        entry.options.get(CONF_GRID_SENSOR, DEFAULT_GRID_SENSOR),
+        entry.options.get(CONF_MAX_CURRENT, DEFAULT_MAX_CURRENT),
+        entry.options.get(CONF_PHASES, DEFAULT_LM_PHASES),
+        session_store,
+        entry.entry_id,
     )
 
+    await coordinator.async_restore_session()
+
     hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
 
     # Try initial refresh
     await coordinator.async_config_entry_first_refresh()
 
+    # Optionally push changed values to a local MQTT broker
+    mqtt_topic = entry.options.get(CONF_MQTT_TOPIC, DEFAULT_MQTT_TOPIC)
+    if mqtt_topic:
+        publisher = SolarEdgeEVChargerAUPublisher(hass, entry, coordinator, mqtt_topic)
+        publisher.start()
+        entry.async_on_unload(publisher.stop)
+
     # Forward setup to a sensor platform
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
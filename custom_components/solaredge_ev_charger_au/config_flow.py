@@ -4,7 +4,7 @@ import aiohttp
 import voluptuous as vol
 from homeassistant import config_entries
 from homeassistant.config_entries import ConfigEntry, OptionsFlow
-from homeassistant.core import callback
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import _FlowResultT
 
 from .const import (
@@ -12,13 +12,22 @@ from .const import (
     CONF_HOST,
     CONF_SCAN_INTERVAL,
     CONF_UNIT_SYSTEM,
+    CONF_MQTT_TOPIC,
+    CONF_GRID_SENSOR,
+    CONF_MAX_CURRENT,
+    CONF_PHASES,
     DEFAULT_HOST,
     DEFAULT_SCAN_INTERVAL,
     DEFAULT_UNIT_SYSTEM,
+    DEFAULT_MQTT_TOPIC,
+    DEFAULT_GRID_SENSOR,
+    DEFAULT_MAX_CURRENT,
+    DEFAULT_LM_MIN_CURRENT,
+    DEFAULT_LM_PHASES,
     UNIT_SYSTEM_W,
     UNIT_SYSTEM_KW,
 )
-from .coordinator import parse_status, parse_and_format
+from .coordinator import async_read_status, async_parse_status, parse_and_format
 
 
 def generate_config_schema(step_id: str, user_input: dict[str, Any]) -> vol.Schema:
@@ -48,23 +57,50 @@ def generate_config_schema(step_id: str, user_input: dict[str, Any]) -> vol.Sche
                 UNIT_SYSTEM_KW: "Kilowatts / Kilowatt-hours (kW, kWh)"
             })
         }
+        schema |= {
+            vol.Optional(
+                CONF_MQTT_TOPIC,
+                default=user_input.get(CONF_MQTT_TOPIC, DEFAULT_MQTT_TOPIC)
+            ): str
+        }
+        schema |= {
+            vol.Optional(
+                CONF_GRID_SENSOR,
+                default=user_input.get(CONF_GRID_SENSOR, DEFAULT_GRID_SENSOR)
+            ): str
+        }
+        schema |= {
+            vol.Required(
+                CONF_MAX_CURRENT,
+                default=user_input.get(CONF_MAX_CURRENT, DEFAULT_MAX_CURRENT)
+            ): vol.All(int, vol.Range(min=DEFAULT_LM_MIN_CURRENT, max=DEFAULT_MAX_CURRENT))
+        }
+        schema |= {
+            vol.Required(
+                CONF_PHASES,
+                default=user_input.get(CONF_PHASES, DEFAULT_LM_PHASES)
+            ): vol.In({
+                1: "Single phase",
+                3: "Three phase"
+            })
+        }
 
     return vol.Schema(schema)
 
 
-async def _async_test_connection(host: str):
+async def _async_test_connection(hass: HomeAssistant, host: str):
     """Attempt to fetch and parse device status, returning the inverter SN."""
     url = f"http://{host}/web/v1/status"
     async with aiohttp.ClientSession() as session:
         async with session.get(url, timeout=10) as resp:
             resp.raise_for_status()
-            raw_data = await resp.read()
+            raw_data = await async_read_status(resp)
 
     # Try parsing it
-    parsed = parse_status(raw_data)
+    parsed = await async_parse_status(hass, raw_data)
     display = parse_and_format(parsed)
     # return top-level inverter SN as unique ID
-    return display.get("inverter_sn")
+    return display.inverter_sn
 
 
 class SolarEdgeEVChargerAUConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
@@ -85,7 +121,7 @@ class SolarEdgeEVChargerAUConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             # Attempt a connection test to fetch the top-level inverter SN
             try:
                 host = user_input.get(CONF_HOST, DEFAULT_HOST)
-                inverter_sn = await _async_test_connection(host)
+                inverter_sn = await _async_test_connection(self.hass, host)
             except Exception:
                 errors[CONF_HOST] = "Unable to connect. Please check the IP address."
             else:
@@ -119,7 +155,7 @@ class SolarEdgeEVChargerAUConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         if user_input is not None:
             # Attempt a connection test to fetch the top-level inverter SN
             try:
-                await _async_test_connection(user_input.get(CONF_HOST, DEFAULT_HOST))
+                await _async_test_connection(self.hass, user_input.get(CONF_HOST, DEFAULT_HOST))
             except Exception:
                 errors[CONF_HOST] = "Unable to connect. Please check the IP address."
             else:
@@ -149,7 +185,11 @@ class SolarEdgeEVChargerAUOptionsFlowHandler(OptionsFlow):
     ) -> _FlowResultT:
         errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            mqtt_topic = user_input.get(CONF_MQTT_TOPIC, DEFAULT_MQTT_TOPIC)
+            if any(char in mqtt_topic for char in ("+", "#", "\0")):
+                errors[CONF_MQTT_TOPIC] = "MQTT topic prefix must not contain wildcards (+ or #)."
+            else:
+                return self.async_create_entry(title="", data=user_input)
         else:
             user_input = {
                 CONF_UNIT_SYSTEM: self.config_entry.options.get(
@@ -158,6 +198,18 @@ class SolarEdgeEVChargerAUOptionsFlowHandler(OptionsFlow):
                 CONF_SCAN_INTERVAL: self.config_entry.options.get(
                     CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
                 ),
+                CONF_MQTT_TOPIC: self.config_entry.options.get(
+                    CONF_MQTT_TOPIC, DEFAULT_MQTT_TOPIC
+                ),
+                CONF_GRID_SENSOR: self.config_entry.options.get(
+                    CONF_GRID_SENSOR, DEFAULT_GRID_SENSOR
+                ),
+                CONF_MAX_CURRENT: self.config_entry.options.get(
+                    CONF_MAX_CURRENT, DEFAULT_MAX_CURRENT
+                ),
+                CONF_PHASES: self.config_entry.options.get(
+                    CONF_PHASES, DEFAULT_LM_PHASES
+                ),
             }
 
         return self.async_show_form(
@@ -3,6 +3,10 @@ DOMAIN = "solaredge_ev_charger_au"
 CONF_HOST = "host"
 CONF_SCAN_INTERVAL = "scan_interval"
 CONF_UNIT_SYSTEM = "unit_system"
+CONF_MQTT_TOPIC = "mqtt_topic"
+CONF_GRID_SENSOR = "grid_sensor"
+CONF_MAX_CURRENT = "max_current"
+CONF_PHASES = "phases"
 
 UNIT_SYSTEM_W = "w_wh"       # Display raw W and Wh
 UNIT_SYSTEM_KW = "kw_kwh"    # Display kW and kWh
@@ -13,3 +17,40 @@ DEFAULT_HOST = ""
 DEFAULT_SCAN_INTERVAL = 30
 
 DEFAULT_UNIT_SYSTEM = UNIT_SYSTEM_W
+
+# NOTE: Payloads up to this size (bytes) are parsed on the event loop,
+# larger ones in an executor; anything above the maximum is rejected
+PARSE_INLINE_MAX_BYTES = 4096
+PARSE_MAX_BYTES = 256 * 1024
+
+# NOTE: This is in seconds
+PARSE_TIMEOUT = 5
+
+# NOTE: An empty topic prefix disables the MQTT publisher
+DEFAULT_MQTT_TOPIC = ""
+DEFAULT_MQTT_QOS = 0
+
+# NOTE: This is in seconds
+DEFAULT_MQTT_RETRY_DELAY = 30
+
+# NOTE: An empty grid sensor disables load management
+DEFAULT_GRID_SENSOR = ""
+DEFAULT_MAX_CURRENT = 32
+
+# NOTE: Poll interval in seconds while load management is active
+DEFAULT_FAST_SCAN_INTERVAL = 5
+
+DEFAULT_LM_MIN_CURRENT = 6
+DEFAULT_LM_VOLTAGE = 230
+# NOTE: Phases the charger supplies, each at DEFAULT_LM_VOLTAGE
+DEFAULT_LM_PHASES = 1
+DEFAULT_LM_HYSTERESIS = 1.5
+# NOTE: Polls to hold a new target while the charger and grid meter catch up
+DEFAULT_LM_SETTLE_POLLS = 1
+
+EVENT_TARGET_CURRENT = f"{DOMAIN}_target_current"
+
+# NOTE: Stored in the Home Assistant config directory
+SESSION_DB_FILE = f"{DOMAIN}_sessions.db"
+
+SERVICE_QUERY_SESSIONS = "query_sessions"
@@ -1,15 +1,32 @@
+import asyncio
 import logging
 import struct
+import sys
 import binascii
+from dataclasses import dataclass, replace
 from datetime import timedelta
 from enum import Enum
+from functools import lru_cache
 
 import aiohttp
 from google.protobuf.internal.decoder import _DecodeVarint
+from google.protobuf.message import DecodeError
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
-
-from .const import DOMAIN
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    DOMAIN,
+    DEFAULT_FAST_SCAN_INTERVAL,
+    DEFAULT_LM_PHASES,
+    EVENT_TARGET_CURRENT,
+    PARSE_INLINE_MAX_BYTES,
+    PARSE_MAX_BYTES,
+    PARSE_TIMEOUT,
+)
+from .load_management import LoadManagementController
+from .session_store import SessionStore
+from .session_tracker import SessionTracker
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -22,17 +39,7 @@ class CarStatus(Enum):
 
     def label(self) -> str:
         """Return a short, lowercase state for Home Assistant."""
-        if self is CarStatus.DISCONNECTED:
-            return "disconnected"
-        elif self is CarStatus.CONNECTED:
-            return "connected"
-        elif self is CarStatus.CHARGING_CAR:
-            return "charging"
-        elif self is CarStatus.RFID_REQ:
-            return "rfid"
-        elif self is CarStatus.UNDEFINED:
-            return "undefined"
-        return f"unknown_{self.value}"
+        return CAR_STATUS_LABELS[self.value]
 
 class ChargerStatus(Enum):
     READY = 0
@@ -45,21 +52,62 @@ class ChargerStatus(Enum):
 
     def label(self) -> str:
         """Return a short, lowercase state for Home Assistant."""
-        if self is ChargerStatus.READY:
-            return "ready"
-        elif self is ChargerStatus.INITIALIZING:
-            return "initializing"
-        elif self is ChargerStatus.CHARGING:
-            return "active"
-        elif self is ChargerStatus.CHARGING_BOOST:
-            return "boost"
-        elif self is ChargerStatus.CHARGING_EXCESS_PV:
-            return "excess_pv"
-        elif self is ChargerStatus.OFF:
-            return "off"
-        elif self is ChargerStatus.ERROR:
-            return "error"
-        return f"unknown_{self.value}"
+        return CHARGER_STATUS_LABELS[self.value]
+
+
+# Raw enum value -> label, looked up once per poll instead of building enums
+CAR_STATUS_LABELS: dict[int, str] = {
+    CarStatus.DISCONNECTED.value: "disconnected",
+    CarStatus.CONNECTED.value: "connected",
+    CarStatus.CHARGING_CAR.value: "charging",
+    CarStatus.RFID_REQ.value: "rfid",
+    CarStatus.UNDEFINED.value: "undefined",
+}
+
+CHARGER_STATUS_LABELS: dict[int, str] = {
+    ChargerStatus.READY.value: "ready",
+    ChargerStatus.INITIALIZING.value: "initializing",
+    ChargerStatus.CHARGING.value: "active",
+    ChargerStatus.CHARGING_BOOST.value: "boost",
+    ChargerStatus.CHARGING_EXCESS_PV.value: "excess_pv",
+    ChargerStatus.OFF.value: "off",
+    ChargerStatus.ERROR.value: "error",
+}
+
+_CAR_STATUS_NAMES = {e.value: e.name for e in CarStatus}
+_CHARGER_STATUS_NAMES = {e.value: e.name for e in ChargerStatus}
+
+
+@dataclass(frozen=True, slots=True)
+class ChargerSnapshot:
+    """Immutable, formatted charger state for one poll.
+
+    Equality compares all fields, so the coordinator can skip listener
+    updates when nothing changed between polls.
+    """
+
+    inverter_sn: str
+    car_status: str
+    charger_status: str
+    charge_power: float | None
+    session_energy: float | None
+    error: str
+    charger_sn: str
+    target_current: float | None = None
+
+    def as_dict(self) -> dict:
+        """Return the snapshot as a plain dict (for diagnostics and publishing)."""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+@lru_cache(maxsize=64)
+def _unknown_label(value: int) -> str:
+    return f"unknown_{value}"
+
+
+@lru_cache(maxsize=64)
+def _error_message(error_code: int, subsystem: int) -> str:
+    return f"Error code={error_code}, subsystem={subsystem}"
 
 
 def decode_ansi_string(raw_bytes: bytes) -> str:
@@ -68,6 +116,56 @@ def decode_ansi_string(raw_bytes: bytes) -> str:
     return ''.join(ch for ch in text if ch >= ' ' and ch != '\x7f')
 
 
+class ProtobufParseError(ValueError):
+    """Raised when the status payload is not valid protobuf.
+
+    ``error`` holds the structured parse error, if one was built.
+    """
+
+    def __init__(self, reason: str, error: dict | None = None):
+        super().__init__(reason)
+        self.error = error
+
+
+# Errors the decoder raises on truncated or corrupt input
+_DECODE_ERRORS = (ProtobufParseError, DecodeError, IndexError, struct.error)
+
+# Bytes shown either side of the failing offset in debug hex dumps
+_HEX_DUMP_CONTEXT = 32
+
+
+def _error_dict(
+    message: str, offset: int | None, field_number: int | None, reason: str, buffer_length: int | None
+) -> dict:
+    """Build the structured parse error reported in diagnostics."""
+    return {
+        "message": message,
+        "offset": offset,
+        "field": field_number,
+        "reason": reason,
+        "buffer_length": buffer_length,
+    }
+
+
+def _parse_error(message: str, buf: bytes, offset: int, field_number: int | None, err: Exception) -> dict:
+    """Build a structured parse error and log it once."""
+    error = _error_dict(message, offset, field_number, f"{type(err).__name__}: {err}", len(buf))
+    _LOGGER.warning(f"Error parsing {message} message: {error}")
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        window = buf[max(offset - _HEX_DUMP_CONTEXT, 0):offset + _HEX_DUMP_CONTEXT]
+        _LOGGER.debug(f"Bytes around offset {offset}: {binascii.hexlify(window)}")
+    return error
+
+
+def _oversize_error(length: int | None) -> ProtobufParseError:
+    """Build the error for a payload above PARSE_MAX_BYTES (length None if unknown)."""
+    size = f"{length} bytes" if length is not None else f"more than {PARSE_MAX_BYTES} bytes"
+    reason = f"Payload of {size} exceeds the {PARSE_MAX_BYTES} byte limit"
+    return ProtobufParseError(
+        reason, _error_dict("status", None, None, f"ProtobufParseError: {reason}", length)
+    )
+
+
 def skip_field(buf: bytes, pos: int, wire_type: int) -> int:
     if wire_type == 0:
         _, pos = _DecodeVarint(buf, pos)  # varint
@@ -79,8 +177,7 @@ def skip_field(buf: bytes, pos: int, wire_type: int) -> int:
     elif wire_type == 5:
         pos += 4  # 32-bit
     else:
-        _LOGGER.error(f"Unknown wire type {wire_type}")
-        raise RuntimeError(f"Unknown wire type {wire_type}")
+        raise ProtobufParseError(f"Unknown wire type {wire_type}")
     return pos
 
 
@@ -100,56 +197,74 @@ def parse_evse(buf: bytes, start: int = 0, end: int = None) -> dict:
         "sn": None
     }
 
-    _LOGGER.debug(f"Starting EVSE message parsing at position {start}, length {end - start} bytes")
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    if debug:
+        _LOGGER.debug(f"Starting EVSE message parsing at position {start}, length {end - start} bytes")
 
+    field_start = pos
+    field_number = None
     try:
         while pos < end:
+            field_start = pos
+            field_number = None
             tag, pos = _DecodeVarint(buf, pos)
             field_number = tag >> 3
             wire_type = tag & 7
 
-            _LOGGER.debug(f"EVSE field: #{field_number}, wire_type: {wire_type}, position: {pos}")
+            if debug:
+                _LOGGER.debug(f"EVSE field: #{field_number}, wire_type: {wire_type}, position: {pos}")
 
             if field_number == 1 and wire_type == 0:
                 val, pos = _DecodeVarint(buf, pos)
                 evse["carStatus"] = val
-                _LOGGER.debug(f"Parsed carStatus: {val} (enum: {CarStatus(val).name if val in [e.value for e in CarStatus] else 'UNKNOWN'})")
+                if debug:
+                    _LOGGER.debug(f"Parsed carStatus: {val} (enum: {_CAR_STATUS_NAMES.get(val, 'UNKNOWN')})")
             elif field_number == 2 and wire_type == 0:
                 val, pos = _DecodeVarint(buf, pos)
                 evse["chargerStatus"] = val
-                _LOGGER.debug(f"Parsed chargerStatus: {val} (enum: {ChargerStatus(val).name if val in [e.value for e in ChargerStatus] else 'UNKNOWN'})")
+                if debug:
+                    _LOGGER.debug(f"Parsed chargerStatus: {val} (enum: {_CHARGER_STATUS_NAMES.get(val, 'UNKNOWN')})")
             elif field_number == 3 and wire_type == 5:
                 evse["chargePower"] = struct.unpack('<f', buf[pos:pos + 4])[0]
-                _LOGGER.debug(f"Parsed chargePower: {evse['chargePower']} W")
+                if debug:
+                    _LOGGER.debug(f"Parsed chargePower: {evse['chargePower']} W")
                 pos += 4
             elif field_number == 4 and wire_type == 5:
                 evse["sessionEnergy"] = struct.unpack('<f', buf[pos:pos + 4])[0]
-                _LOGGER.debug(f"Parsed sessionEnergy: {evse['sessionEnergy']} Wh")
+                if debug:
+                    _LOGGER.debug(f"Parsed sessionEnergy: {evse['sessionEnergy']} Wh")
                 pos += 4
             elif field_number == 5 and wire_type == 0:
                 val, pos = _DecodeVarint(buf, pos)
                 evse["errorCode"] = val
-                _LOGGER.debug(f"Parsed errorCode: {val}")
+                if debug:
+                    _LOGGER.debug(f"Parsed errorCode: {val}")
             elif field_number == 6 and wire_type == 0:
                 val, pos = _DecodeVarint(buf, pos)
                 evse["subsystem"] = val
-                _LOGGER.debug(f"Parsed subsystem: {val}")
+                if debug:
+                    _LOGGER.debug(f"Parsed subsystem: {val}")
             elif field_number == 7 and wire_type == 2:
                 length, pos = _DecodeVarint(buf, pos)
                 evse["sn"] = decode_ansi_string(buf[pos:pos + length])
-                _LOGGER.debug(f"Parsed EVSE sn: {evse['sn']}")
+                if debug:
+                    _LOGGER.debug(f"Parsed EVSE sn: {evse['sn']}")
                 pos += length
             else:
                 old_pos = pos
                 pos = skip_field(buf, pos, wire_type)
-                _LOGGER.debug(f"Skipped unknown field {field_number} (wire_type={wire_type}), advanced {pos - old_pos} bytes")
+                if debug:
+                    _LOGGER.debug(f"Skipped unknown field {field_number} (wire_type={wire_type}), advanced {pos - old_pos} bytes")
 
-    except Exception as e:
-        _LOGGER.error(f"Error parsing EVSE message: {e}")
-        _LOGGER.debug(f"EVSE parse buffer: {binascii.hexlify(buf[start:end])}")
+            if pos > end:
+                raise ProtobufParseError(f"Field runs {pos - end} bytes past the end of the message")
+
+    except _DECODE_ERRORS as e:
         # Return partial results, if any
+        evse["parse_error"] = _parse_error("EVSE", buf, field_start, field_number, e)
 
-    _LOGGER.debug(f"Completed EVSE parsing with results: {evse}")
+    if debug:
+        _LOGGER.debug(f"Completed EVSE parsing with results: {evse}")
     return evse
 
 
@@ -159,135 +274,263 @@ def parse_status(buf: bytes) -> dict:
     pos = 0
     end = len(buf)
 
-    _LOGGER.debug(f"Starting protobuf parsing, buffer size: {len(buf)} bytes")
-    _LOGGER.debug(f"Buffer hex dump: {binascii.hexlify(buf)}")
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    if debug:
+        _LOGGER.debug(f"Starting protobuf parsing, buffer size: {len(buf)} bytes")
+        _LOGGER.debug(f"Buffer hex dump: {binascii.hexlify(buf)}")
 
+    field_start = pos
+    field_number = None
     try:
         while pos < end:
+            field_start = pos
+            field_number = None
             tag, pos = _DecodeVarint(buf, pos)
             field_number = tag >> 3
             wire_type = tag & 7
 
-            _LOGGER.debug(f"Top-level field: #{field_number}, wire_type: {wire_type}, position: {pos}")
+            if debug:
+                _LOGGER.debug(f"Top-level field: #{field_number}, wire_type: {wire_type}, position: {pos}")
 
             if field_number == 1 and wire_type == 2:
                 length, pos = _DecodeVarint(buf, pos)
                 status["sn"] = decode_ansi_string(buf[pos:pos + length])
-                _LOGGER.debug(f"Parsed inverter sn: {status['sn']}")
+                if debug:
+                    _LOGGER.debug(f"Parsed inverter sn: {status['sn']}")
                 pos += length
             elif field_number == 38 and wire_type == 2:
                 length, pos = _DecodeVarint(buf, pos)
                 sub_end = pos + length
-                _LOGGER.debug(f"Found EVSE submessage at position {pos}, length {length}")
+                if debug:
+                    _LOGGER.debug(f"Found EVSE submessage at position {pos}, length {length}")
+                if sub_end > end:
+                    raise ProtobufParseError(f"EVSE submessage runs {sub_end - end} bytes past the end of the buffer")
                 status["evse"] = parse_evse(buf, pos, sub_end)
+                if "parse_error" in status["evse"]:
+                    status["parse_error"] = status["evse"]["parse_error"]
                 pos = sub_end
             else:
                 old_pos = pos
                 pos = skip_field(buf, pos, wire_type)
-                _LOGGER.debug(f"Skipped unknown field {field_number} (wire_type={wire_type}), advanced {pos - old_pos} bytes")
-    except Exception as e:
-        _LOGGER.error(f"Error parsing top-level status: {e}")
-        _LOGGER.debug(f"Full buffer hex dump: {binascii.hexlify(buf)}")
+                if debug:
+                    _LOGGER.debug(f"Skipped unknown field {field_number} (wire_type={wire_type}), advanced {pos - old_pos} bytes")
+
+            if pos > end:
+                raise ProtobufParseError(f"Field runs {pos - end} bytes past the end of the buffer")
+    except _DECODE_ERRORS as e:
         # Return partial results, if any
+        status["parse_error"] = _parse_error("status", buf, field_start, field_number, e)
 
-    _LOGGER.debug(f"Completed status parsing with results: {status}")
+    if debug:
+        _LOGGER.debug(f"Completed status parsing with results: {status}")
     return status
 
 
-def parse_and_format(status: dict) -> dict:
+def parse_and_format(status: dict) -> ChargerSnapshot:
     """Convert raw status dict into short, lowercased results for Home Assistant."""
-    inverter_sn = status.get("sn") or "N/A"
+    inverter_sn = sys.intern(status.get("sn") or "N/A")
     evse = status.get("evse") or {}
 
-    _LOGGER.debug(f"Formatting status data: {status}")
+    debug = _LOGGER.isEnabledFor(logging.DEBUG)
+    if debug:
+        _LOGGER.debug(f"Formatting status data: {status}")
 
     # Car status
     raw_car_status = evse.get("carStatus")
     if raw_car_status is not None:
-        try:
-            car_enum = CarStatus(raw_car_status)
-            car_status_text = car_enum.label()  # e.g., "charging"
-            _LOGGER.debug(f"Formatted car status: {raw_car_status} -> {car_status_text}")
-        except ValueError:
-            car_status_text = f"unknown_{raw_car_status}"
+        car_status_text = CAR_STATUS_LABELS.get(raw_car_status)
+        if car_status_text is None:
+            car_status_text = _unknown_label(raw_car_status)
             _LOGGER.warning(f"Unknown car status value: {raw_car_status}")
     else:
         car_status_text = "n/a"
-        _LOGGER.debug("No car status found in data")
 
     # Charger status
     raw_charger_status = evse.get("chargerStatus")
     if raw_charger_status is not None:
-        try:
-            ch_enum = ChargerStatus(raw_charger_status)
-            charger_status_text = ch_enum.label()
-            _LOGGER.debug(f"Formatted charger status: {raw_charger_status} -> {charger_status_text}")
-        except ValueError:
-            charger_status_text = f"unknown_{raw_charger_status}"
+        charger_status_text = CHARGER_STATUS_LABELS.get(raw_charger_status)
+        if charger_status_text is None:
+            charger_status_text = _unknown_label(raw_charger_status)
             _LOGGER.warning(f"Unknown charger status value: {raw_charger_status}")
     else:
         charger_status_text = "n/a"
-        _LOGGER.debug("No charger status found in data")
 
     charge_power = evse.get("chargePower")
-    if charge_power is not None:
-        _LOGGER.debug(f"Charge power: {charge_power} W")
-    else:
-        _LOGGER.debug("No charge power found in data")
-
     session_energy = evse.get("sessionEnergy")
-    if session_energy is not None:
-        _LOGGER.debug(f"Session energy: {session_energy} Wh")
-    else:
-        _LOGGER.debug("No session energy found in data")
 
     # Error, if any
     error_msg = ""
     subsystem = evse.get("subsystem")
     error_code = evse.get("errorCode")
     if subsystem is not None and error_code is not None and error_code != 0:
-        error_msg = f"Error code={error_code}, subsystem={subsystem}"
-        _LOGGER.debug(f"Error detected: {error_msg}")
+        error_msg = _error_message(error_code, subsystem)
+
+    charger_sn = sys.intern(evse.get("sn") or "")
+
+    snapshot = ChargerSnapshot(
+        inverter_sn=inverter_sn,
+        car_status=car_status_text,
+        charger_status=charger_status_text,
+        charge_power=charge_power,
+        session_energy=session_energy,
+        error=error_msg,
+        charger_sn=charger_sn,
+    )
+
+    if debug:
+        # Missing fields show up as None / "n/a" here
+        _LOGGER.debug(f"Final formatted result: {snapshot}")
+    return snapshot
+
+
+async def async_read_status(resp: aiohttp.ClientResponse) -> bytes:
+    """Read a status response body, rejecting anything above PARSE_MAX_BYTES."""
+    if resp.content_length is not None and resp.content_length > PARSE_MAX_BYTES:
+        raise _oversize_error(resp.content_length)
+    # Bound the read for chunked bodies without a Content-Length
+    try:
+        await resp.content.readexactly(PARSE_MAX_BYTES + 1)
+    except asyncio.IncompleteReadError as err:
+        return err.partial
+    raise _oversize_error(None)
 
-    charger_sn = evse.get("sn") or ""
-    if charger_sn:
-        _LOGGER.debug(f"Charger SN: {charger_sn}")
-    else:
-        _LOGGER.debug("No charger SN found in data")
-
-    formatted_result = {
-        "inverter_sn": inverter_sn,
-        "car_status": car_status_text,
-        "charger_status": charger_status_text,
-        "charge_power": charge_power,
-        "session_energy": session_energy,
-        "error": error_msg,
-        "charger_sn": charger_sn
-    }
 
-    _LOGGER.debug(f"Final formatted result: {formatted_result}")
-    return formatted_result
+async def async_parse_status(hass: HomeAssistant, raw_data: bytes) -> dict:
+    """Parse small payloads inline, larger ones in an executor within a time budget."""
+    if len(raw_data) > PARSE_MAX_BYTES:
+        raise _oversize_error(len(raw_data))
+    if len(raw_data) <= PARSE_INLINE_MAX_BYTES:
+        return parse_status(raw_data)
+
+    _LOGGER.debug(f"Parsing {len(raw_data)} byte payload in executor")
+    try:
+        async with asyncio.timeout(PARSE_TIMEOUT):
+            return await hass.async_add_executor_job(parse_status, raw_data)
+    except TimeoutError:
+        reason = f"Parsing {len(raw_data)} byte payload took longer than {PARSE_TIMEOUT}s"
+        raise ProtobufParseError(
+            reason, _error_dict("status", None, None, f"ProtobufParseError: {reason}", len(raw_data))
+        ) from None
 
 
 class SolarEdgeEVChargerAUDataUpdateCoordinator(DataUpdateCoordinator):
     """Coordinator to fetch data from the EV Charger (AU) endpoint."""
 
-    def __init__(self, hass: HomeAssistant, host: str, scan_interval: int):
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        host: str,
+        scan_interval: int,
+        grid_sensor: str = "",
+        max_current: float | None = None,
+        phases: int = DEFAULT_LM_PHASES,
+        session_store: SessionStore | None = None,
+        entry_id: str | None = None,
+    ):
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(seconds=scan_interval),
+            # Only notify listeners when the snapshot actually changed
+            always_update=False,
         )
         self.host = host
         self._last_raw_data = None  # Store the last raw data received
+        self._scan_interval = timedelta(seconds=scan_interval)
+        self._fast_scan_interval = min(
+            self._scan_interval, timedelta(seconds=DEFAULT_FAST_SCAN_INTERVAL)
+        )
+        self.last_parse_error = None  # Structured error from the last poll, if any
+        self.grid_sensor = grid_sensor
+        self.load_controller = (
+            LoadManagementController(max_current, phases=phases) if grid_sensor else None
+        )
+        self.session_store = session_store
+        self.session_tracker = SessionTracker()
+        self._persisted_session = None
+        self.entry_id = entry_id
         _LOGGER.debug(f"Initialized coordinator with host={host}, scan_interval={scan_interval}s")
 
-    async def _async_update_data(self) -> dict:
+    async def _async_update_data(self) -> ChargerSnapshot:
         """Perform actual async fetch using aiohttp."""
-        return await self._fetch_data()
-
-    async def _fetch_data(self) -> dict:
+        snapshot = await self._fetch_data()
+        if self.load_controller is not None:
+            snapshot = self._run_load_management(snapshot)
+        if self.session_store is not None:
+            await self._track_session(snapshot)
+        return snapshot
+
+    async def async_restore_session(self) -> None:
+        """Resume a session left open by a restart or reload."""
+        try:
+            state = await self.session_store.async_get_open(self.entry_id)
+        except Exception as err:
+            _LOGGER.error(f"Error loading open charging session: {type(err).__name__}: {err}")
+            return
+        self.session_tracker = SessionTracker(state)
+        self._persisted_session = state
+
+    async def _track_session(self, snapshot: ChargerSnapshot) -> None:
+        """Append the charging session to the store once it completes."""
+        record = self.session_tracker.update(snapshot, dt_util.utcnow().timestamp())
+        state = self.session_tracker.state
+        try:
+            if record is not None:
+                await self.session_store.async_add(self.entry_id, record)
+            if state != self._persisted_session:
+                await self.session_store.async_set_open(self.entry_id, state)
+                self._persisted_session = state
+        except Exception as err:
+            _LOGGER.error(f"Error storing charging session: {type(err).__name__}: {err}")
+
+    def _get_grid_power(self) -> float | None:
+        """Return the site grid power in W (positive = import), if available."""
+        state = self.hass.states.get(self.grid_sensor)
+        if state is None:
+            _LOGGER.debug(f"Grid sensor {self.grid_sensor} not found")
+            return None
+        try:
+            value = float(state.state)
+        except ValueError:
+            _LOGGER.debug(f"Grid sensor {self.grid_sensor} has no numeric state: {state.state}")
+            return None
+        if state.attributes.get("unit_of_measurement") == "kW":
+            value *= 1000
+        return value
+
+    def _run_load_management(self, snapshot: ChargerSnapshot) -> ChargerSnapshot:
+        """Step the load controller and poll fast while a car is plugged in."""
+        previous_target = self.load_controller.target_current
+
+        if snapshot.car_status == "disconnected":
+            active = False
+            self.load_controller.reset()
+            target = 0
+        elif snapshot.car_status in ("connected", "charging", "rfid"):
+            active = True
+            target = self.load_controller.update(
+                snapshot.charge_power, self._get_grid_power()
+            )
+        else:
+            # Missing or unknown status, keep the target and poll interval
+            _LOGGER.debug(f"Unclear car status {snapshot.car_status}, keeping target current {previous_target} A")
+            return replace(snapshot, target_current=previous_target)
+
+        if target != previous_target:
+            self.hass.bus.async_fire(
+                EVENT_TARGET_CURRENT,
+                {"host": self.host, "target_current": target},
+            )
+
+        update_interval = self._fast_scan_interval if active else self._scan_interval
+        if update_interval != self.update_interval:
+            _LOGGER.debug(f"Changing poll interval to {update_interval.total_seconds()}s (load management active={active})")
+            self.update_interval = update_interval
+
+        return replace(snapshot, target_current=target)
+
+    async def _fetch_data(self) -> ChargerSnapshot:
         """Load status from the charger, parse it."""
         url = f"http://{self.host}/web/v1/status"
         _LOGGER.debug(f"Fetching data from: {url}")
@@ -297,16 +540,28 @@ class SolarEdgeEVChargerAUDataUpdateCoordinator(DataUpdateCoordinator):
                 async with session.get(url, timeout=10) as resp:
                     _LOGGER.debug(f"HTTP response status: {resp.status}")
                     resp.raise_for_status()
-                    raw_data = await resp.read()
+                    raw_data = await async_read_status(resp)
                     _LOGGER.debug(f"Received {len(raw_data)} bytes of raw data")
 
                     # Store the raw data for diagnostics
                     self._last_raw_data = raw_data
 
-            parsed = parse_status(raw_data)
-            formatted = parse_and_format(parsed)
-            return formatted
-
+            parsed = await async_parse_status(self.hass, raw_data)
+            parse_error = parsed.get("parse_error")
+            if parse_error is not None and parsed.get("evse") is None:
+                # Without the EVSE submessage every value would be "n/a";
+                # fail the poll so the previous data is kept instead
+                raise ProtobufParseError(parse_error["reason"], parse_error)
+            self.last_parse_error = parse_error
+            return parse_and_format(parsed)
+
+        except ProtobufParseError as err:
+            self.last_parse_error = err.error or _error_dict(
+                "status", None, None, f"{type(err).__name__}: {err}", None
+            )
+            error_msg = f"Invalid payload from {url}: {err}"
+            _LOGGER.error(error_msg)
+            raise UpdateFailed(error_msg)
         except aiohttp.ClientError as err:
             error_msg = f"Connection error fetching data from {url}: {err}"
             _LOGGER.error(error_msg)
@@ -315,4 +570,4 @@ class SolarEdgeEVChargerAUDataUpdateCoordinator(DataUpdateCoordinator):
             error_msg = f"Error fetching/parsing data from {url}: {type(err).__name__}: {err}"
             _LOGGER.error(error_msg)
             _LOGGER.debug(f"Exception details:", exc_info=True)
-            raise UpdateFailed(error_msg)
\ No newline at end of file
+            raise UpdateFailed(error_msg)
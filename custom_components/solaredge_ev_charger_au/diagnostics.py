@@ -33,7 +33,7 @@ async def async_get_config_entry_diagnostics(
     config_data = async_redact_data(entry.data, TO_REDACT)
 
     # Fetch and format data from the coordinator
-    coordinator_data = coordinator.data or {}
+    coordinator_data = coordinator.data.as_dict() if coordinator.data else {}
     coordinator_data_formatted = {
         "charger_sn": coordinator_data.get("charger_sn", "unknown"),
         "inverter_sn": coordinator_data.get("inverter_sn", "unknown"),
@@ -42,6 +42,7 @@ async def async_get_config_entry_diagnostics(
         "charge_power": coordinator_data.get("charge_power", "n/a"),
         "session_energy": coordinator_data.get("session_energy", "n/a"),
         "error_message": coordinator_data.get("error", "No errors reported"),
+        "target_current": coordinator_data.get("target_current", "n/a"),
     }
 
     # Fetch associated devices
@@ -66,7 +67,8 @@ async def async_get_config_entry_diagnostics(
             raw_buffer_data = {
                 "buffer_hex": binascii.hexlify(raw_data).decode("ascii"),
                 "buffer_length": len(raw_data),
-                "parse_attempt": parse_status(raw_data)
+                "parse_attempt": await hass.async_add_executor_job(parse_status, raw_data),
+                "last_parse_error": coordinator.last_parse_error,
             }
         else:
             raw_buffer_data = {
@@ -0,0 +1,90 @@
+import logging
+import math
+
+from .const import (
+    DEFAULT_LM_MIN_CURRENT,
+    DEFAULT_LM_VOLTAGE,
+    DEFAULT_LM_PHASES,
+    DEFAULT_LM_HYSTERESIS,
+    DEFAULT_LM_SETTLE_POLLS,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class LoadManagementController:
+    """Compute an excess-PV target charge current from charger and grid power.
+
+    The controller is a plain state machine with no Home Assistant
+    dependencies, so it can be stepped against a simulated charger.
+    Grid power is positive when importing and negative when exporting.
+
+    After each change the target is held for ``settle_polls`` samples: the
+    charger needs a poll to apply it and the grid meter may report a
+    sample taken before that, which would otherwise make the loop hunt.
+    """
+
+    def __init__(
+        self,
+        max_current: float,
+        min_current: float = DEFAULT_LM_MIN_CURRENT,
+        voltage: float = DEFAULT_LM_VOLTAGE,
+        phases: int = DEFAULT_LM_PHASES,
+        hysteresis: float = DEFAULT_LM_HYSTERESIS,
+        settle_polls: int = DEFAULT_LM_SETTLE_POLLS,
+    ):
+        self.max_current = max_current
+        self.min_current = min_current
+        self.voltage = voltage
+        self.phases = phases
+        self.hysteresis = hysteresis
+        self.settle_polls = settle_polls
+        self.target_current: float = 0
+        self._hold = 0
+
+    def available_current(self, charge_power: float | None, grid_power: float) -> float:
+        """Return the current the car could draw without importing from the grid."""
+        surplus = (charge_power or 0) - grid_power
+        return surplus / (self.voltage * self.phases)
+
+    def update(self, charge_power: float | None, grid_power: float | None) -> float:
+        """Feed one sample and return the new target current (0 means stop)."""
+        if grid_power is None:
+            _LOGGER.debug("No grid power sample, keeping target current")
+            return self.target_current
+
+        if self._hold > 0:
+            self._hold -= 1
+            _LOGGER.debug(f"Holding target current {self.target_current} A while the charger settles")
+            return self.target_current
+
+        available = self.available_current(charge_power, grid_power)
+
+        if self.target_current == 0:
+            # Only start once there is a clear surplus above the minimum
+            if available >= self.min_current + self.hysteresis:
+                target = min(math.floor(available), self.max_current)
+            else:
+                target = 0
+        elif available < self.min_current - self.hysteresis:
+            # Stop only once the surplus drops clearly below the minimum
+            target = 0
+        else:
+            target = min(max(math.floor(available), self.min_current), self.max_current)
+            # Ignore small adjustments to avoid hunting around the set point
+            if abs(target - self.target_current) < self.hysteresis:
+                target = self.target_current
+
+        if target != self.target_current:
+            _LOGGER.debug(
+                f"Target current changed: {self.target_current} A -> {target} A "
+                f"(charge_power={charge_power} W, grid_power={grid_power} W, available={available:.2f} A)"
+            )
+            self._hold = self.settle_polls
+        self.target_current = target
+        return target
+
+    def reset(self) -> None:
+        """Forget the current target, e.g. when the car is unplugged."""
+        self.target_current = 0
+        self._hold = 0
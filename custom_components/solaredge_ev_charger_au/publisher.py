@@ -0,0 +1,142 @@
+import asyncio
+import json
+import logging
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .const import DOMAIN, DEFAULT_MQTT_QOS, DEFAULT_MQTT_RETRY_DELAY
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class SolarEdgeEVChargerAUPublisher:
+    """Push formatted charger records to a local MQTT broker.
+
+    Each key of the record is published to its own retained topic
+    (``<prefix>/<key>``) only when its value changed since the last poll.
+    All changes from one poll are sent together, followed by a single
+    compact JSON message of the changed keys on ``<prefix>/state``.
+
+    The current record is published once on start, so retained topics are
+    filled even when the charger stays idle. A failed batch is retried
+    after ``DEFAULT_MQTT_RETRY_DELAY`` seconds, as is a batch skipped
+    because MQTT is not available yet.
+    """
+
+    def __init__(self, hass: HomeAssistant, entry: ConfigEntry, coordinator, topic_prefix: str):
+        self.hass = hass
+        self.entry = entry
+        self.coordinator = coordinator
+        self.topic_prefix = topic_prefix.rstrip("/")
+        self._last_published: dict = {}
+        self._unsub = None
+        self._unsub_retry = None
+        self._task: asyncio.Task | None = None
+        self._mqtt_available = False
+        self._warned_unavailable = False
+
+    def start(self) -> None:
+        """Start listening for coordinator updates and publish the current record."""
+        self._unsub = self.coordinator.async_add_listener(self._handle_coordinator_update)
+        self._handle_coordinator_update()
+        _LOGGER.debug(f"MQTT publisher started with topic prefix {self.topic_prefix}")
+
+    def stop(self) -> None:
+        """Stop listening for coordinator updates."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+        if self._unsub_retry is not None:
+            self._unsub_retry()
+            self._unsub_retry = None
+        if self._task is not None and not self._task.done():
+            self._task.cancel()
+        self._task = None
+
+    def _changed_values(self) -> dict:
+        """Return the values that differ from what was last published."""
+        data = self.coordinator.data
+        if not data:
+            return {}
+        return {
+            key: value
+            for key, value in data.as_dict().items()
+            if key not in self._last_published or self._last_published[key] != value
+        }
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Schedule a publish batch unless one is already in flight."""
+        # A running batch re-checks the latest data before it finishes,
+        # so changes arriving meanwhile are picked up there.
+        if self._task is not None and not self._task.done():
+            _LOGGER.debug("Previous MQTT batch still in flight, deferring publish")
+            return
+
+        if not self._changed_values():
+            _LOGGER.debug("No changed values, skipping MQTT publish")
+            return
+
+        # Background task: waiting for MQTT must not block startup
+        self._task = self.entry.async_create_background_task(
+            self.hass, self._async_publish(), f"{DOMAIN} MQTT publish"
+        )
+
+    def _schedule_retry(self) -> None:
+        """Retry pending values later; they are kept until published."""
+        if self._unsub_retry is None:
+            self._unsub_retry = async_call_later(
+                self.hass, DEFAULT_MQTT_RETRY_DELAY, self._handle_retry
+            )
+
+    @callback
+    def _handle_retry(self, _now) -> None:
+        """Retry a failed batch."""
+        self._unsub_retry = None
+        self._handle_coordinator_update()
+
+    async def _async_publish(self) -> None:
+        """Publish changed values until the latest data has been sent."""
+        from homeassistant.components import mqtt
+
+        if not self._mqtt_available:
+            if not await mqtt.async_wait_for_mqtt_client(self.hass):
+                # Warn once; retry quietly until MQTT is set up
+                if not self._warned_unavailable:
+                    _LOGGER.warning("MQTT is not available, unable to publish charger data")
+                    self._warned_unavailable = True
+                self._schedule_retry()
+                return
+            self._mqtt_available = True
+
+        while changed := self._changed_values():
+            try:
+                await asyncio.gather(*(
+                    mqtt.async_publish(
+                        self.hass,
+                        f"{self.topic_prefix}/{key}",
+                        "" if value is None else str(value),
+                        DEFAULT_MQTT_QOS,
+                        True,
+                    )
+                    for key, value in changed.items()
+                ))
+                await mqtt.async_publish(
+                    self.hass,
+                    f"{self.topic_prefix}/state",
+                    json.dumps(changed, separators=(",", ":")),
+                    DEFAULT_MQTT_QOS,
+                    False,
+                )
+            except Exception as err:
+                _LOGGER.error(
+                    f"Error publishing charger data to MQTT, retrying in {DEFAULT_MQTT_RETRY_DELAY}s: "
+                    f"{type(err).__name__}: {err}"
+                )
+                self._schedule_retry()
+                return
+
+            self._last_published.update(changed)
+            _LOGGER.debug(f"Published {len(changed)} changed value(s) to MQTT: {changed}")
@@ -76,6 +76,19 @@ async def async_setup_entry(
         ),
     ]
 
+    if coordinator.load_controller is not None:
+        sensors.append(
+            SolarEdgeEVChargerSensor(
+                coordinator,
+                entry,
+                "target_current",
+                "SolarEdge EV Charger Target Current",
+                "Charge current that matches the excess PV power (0 = stop).",
+                SensorDeviceClass.CURRENT,
+                SensorStateClass.MEASUREMENT,
+            )
+        )
+
     async_add_entities(sensors)
 
 
@@ -107,7 +120,7 @@ class SolarEdgeEVChargerSensor(CoordinatorEntity, SensorEntity):
     @property
     def native_value(self):
         """Return the state of the sensor."""
-        value = self.coordinator.data.get(self._key)
+        value = getattr(self.coordinator.data, self._key)
 
         # Adjust units for session_energy and charge_power
         if self._key == "charge_power" and value is not None:
@@ -124,6 +137,8 @@ class SolarEdgeEVChargerSensor(CoordinatorEntity, SensorEntity):
             return "kW" if self._unit_system == UNIT_SYSTEM_KW else "W"
         if self._key == "session_energy":
             return "kWh" if self._unit_system == UNIT_SYSTEM_KW else "Wh"
+        if self._key == "target_current":
+            return "A"
         return None
 
     @property
@@ -134,8 +149,8 @@ class SolarEdgeEVChargerSensor(CoordinatorEntity, SensorEntity):
     @property
     def device_info(self):
         """Return device information for grouping into an area."""
-        charger_sn = self.coordinator.data.get("charger_sn", "unknown_charger_sn")
-        inverter_sn = self.coordinator.data.get("inverter_sn", "unknown_inverter_sn")
+        charger_sn = self.coordinator.data.charger_sn
+        inverter_sn = self.coordinator.data.inverter_sn
 
         return dict(
             identifiers={(DOMAIN, f"{charger_sn}_{inverter_sn}")},
@@ -0,0 +1,182 @@
+import logging
+import sqlite3
+from datetime import datetime
+
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS sessions (
+        id INTEGER PRIMARY KEY,
+        entry_id TEXT NOT NULL,
+        start REAL NOT NULL,
+        end REAL NOT NULL,
+        day TEXT NOT NULL,
+        energy_kwh REAL NOT NULL,
+        peak_kw REAL NOT NULL,
+        mode TEXT NOT NULL
+    )""",
+    "CREATE INDEX IF NOT EXISTS sessions_entry_start ON sessions (entry_id, start)",
+    "CREATE INDEX IF NOT EXISTS sessions_start ON sessions (start)",
+    "CREATE INDEX IF NOT EXISTS sessions_day ON sessions (day)",
+    """CREATE TABLE IF NOT EXISTS open_sessions (
+        entry_id TEXT PRIMARY KEY,
+        start REAL NOT NULL,
+        end REAL NOT NULL,
+        energy REAL,
+        energy_rose INTEGER NOT NULL,
+        peak_power REAL NOT NULL
+    )""",
+)
+
+GROUP_BY_NONE = "none"
+GROUP_BY_DAY = "day"
+GROUP_BY_MONTH = "month"
+
+
+class SessionStore:
+    """Append-only SQLite store of completed charging sessions.
+
+    Also keeps the state of each charger's open session, so a restart or
+    an options change (which reloads the entry) does not split it.
+    """
+
+    def __init__(self, hass: HomeAssistant, path: str):
+        self.hass = hass
+        self.path = path
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path)
+
+    def _setup(self) -> None:
+        with self._connect() as conn:
+            columns = [row[1] for row in conn.execute("PRAGMA table_info(open_sessions)")]
+            if columns and "energy" not in columns:
+                # Older layout without the session energy; the open state is
+                # short-lived, so recreate the table rather than migrate it
+                conn.execute("DROP TABLE open_sessions")
+            for statement in _SCHEMA:
+                conn.execute(statement)
+        conn.close()
+
+    def _add(self, entry_id: str, record: dict) -> None:
+        day = dt_util.as_local(dt_util.utc_from_timestamp(record["start"])).date().isoformat()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO sessions (entry_id, start, end, day, energy_kwh, peak_kw, mode) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (entry_id, record["start"], record["end"], day,
+                 record["energy_kwh"], record["peak_kw"], record["mode"]),
+            )
+        conn.close()
+
+    def _get_open(self, entry_id: str) -> tuple | None:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT start, end, energy, energy_rose, peak_power FROM open_sessions WHERE entry_id = ?",
+                (entry_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        return (row[0], row[1], row[2], bool(row[3]), row[4])
+
+    def _set_open(self, entry_id: str, state: tuple | None) -> None:
+        with self._connect() as conn:
+            if state is None:
+                conn.execute("DELETE FROM open_sessions WHERE entry_id = ?", (entry_id,))
+            else:
+                conn.execute(
+                    "INSERT OR REPLACE INTO open_sessions "
+                    "(entry_id, start, end, energy, energy_rose, peak_power) VALUES (?, ?, ?, ?, ?, ?)",
+                    (entry_id, state[0], state[1], state[2], int(state[3]), state[4]),
+                )
+        conn.close()
+
+    def _query(
+        self,
+        start: float | None,
+        end: float | None,
+        group_by: str,
+        entry_id: str | None,
+    ) -> list[dict]:
+        where = ["start >= ?", "start < ?"]
+        params: list = [start if start is not None else 0, end if end is not None else float("inf")]
+        if entry_id:
+            where.insert(0, "entry_id = ?")
+            params.insert(0, entry_id)
+        where_sql = " AND ".join(where)
+
+        conn = self._connect()
+        try:
+            if group_by == GROUP_BY_NONE:
+                rows = conn.execute(
+                    f"SELECT start, end, energy_kwh, peak_kw, mode FROM sessions "
+                    f"WHERE {where_sql} ORDER BY start",
+                    params,
+                ).fetchall()
+                return [
+                    {
+                        "start": dt_util.as_local(dt_util.utc_from_timestamp(row[0])).isoformat(),
+                        "end": dt_util.as_local(dt_util.utc_from_timestamp(row[1])).isoformat(),
+                        "energy_kwh": row[2],
+                        "peak_kw": row[3],
+                        "mode": row[4],
+                    }
+                    for row in rows
+                ]
+
+            period = "day" if group_by == GROUP_BY_DAY else "substr(day, 1, 7)"
+            rows = conn.execute(
+                f"SELECT {period} AS period, COUNT(*), SUM(energy_kwh), MAX(peak_kw), SUM(end - start) "
+                f"FROM sessions WHERE {where_sql} GROUP BY period ORDER BY period",
+                params,
+            ).fetchall()
+            return [
+                {
+                    "period": row[0],
+                    "sessions": row[1],
+                    "energy_kwh": round(row[2], 3),
+                    "peak_kw": row[3],
+                    "duration_h": round(row[4] / 3600, 2),
+                }
+                for row in rows
+            ]
+        finally:
+            conn.close()
+
+    async def async_setup(self) -> None:
+        """Create the database and indexes if needed."""
+        await self.hass.async_add_executor_job(self._setup)
+
+    async def async_add(self, entry_id: str, record: dict) -> None:
+        """Append a completed session."""
+        await self.hass.async_add_executor_job(self._add, entry_id, record)
+
+    async def async_get_open(self, entry_id: str) -> tuple | None:
+        """Return the persisted open session state, if any."""
+        return await self.hass.async_add_executor_job(self._get_open, entry_id)
+
+    async def async_set_open(self, entry_id: str, state: tuple | None) -> None:
+        """Persist the open session state, or clear it with None."""
+        await self.hass.async_add_executor_job(self._set_open, entry_id, state)
+
+    async def async_query(
+        self,
+        start: datetime | None = None,
+        end: datetime | None = None,
+        group_by: str = GROUP_BY_NONE,
+        entry_id: str | None = None,
+    ) -> list[dict]:
+        """Return sessions, or per-day/month aggregates, starting within [start, end)."""
+        return await self.hass.async_add_executor_job(
+            self._query,
+            dt_util.as_utc(start).timestamp() if start else None,
+            dt_util.as_utc(end).timestamp() if end else None,
+            group_by,
+            entry_id,
+        )
@@ -0,0 +1,98 @@
+import logging
+from collections import Counter
+
+_LOGGER = logging.getLogger(__name__)
+
+# car_status labels while a car is plugged in
+_PLUGGED_STATES = ("connected", "charging", "rfid")
+
+
+class SessionTracker:
+    """Detect charging session boundaries from consecutive snapshots.
+
+    A session starts when a car is plugged in and ends when it is unplugged
+    or the charger resets the session energy counter after it has risen.
+    The charger may still show the previous session's counter at plug-in;
+    a reset of that stale value only moves the baseline. Only sessions
+    whose counter rose are reported.
+
+    ``state`` is a (start, end, energy, energy_rose, peak_power) tuple for
+    the open session, so it can be persisted and passed back in after a
+    reload. A resumed session is closed on the first clear reading if the
+    car was unplugged or the counter reset while it was not tracked.
+    """
+
+    def __init__(self, state: tuple | None = None):
+        self._resume = state
+        self._reset()
+
+    def _reset(self) -> None:
+        self._start: float | None = None
+        self._end: float | None = None
+        self._energy: float | None = None
+        self._energy_rose = False
+        self._peak_power = 0.0
+        self._modes: Counter = Counter()
+
+    @property
+    def state(self) -> tuple | None:
+        """Return the open session as (start, end, energy, energy_rose, peak_power), if any."""
+        if self._start is None:
+            return self._resume
+        return (self._start, self._end, self._energy, self._energy_rose, self._peak_power)
+
+    def update(self, snapshot, now: float) -> dict | None:
+        """Feed one snapshot; return a completed session record, if any."""
+        if snapshot.car_status == "disconnected":
+            plugged = False
+        elif snapshot.car_status in _PLUGGED_STATES:
+            plugged = True
+        else:
+            # Missing or unknown status, wait for a clear reading
+            return None
+
+        if self._resume is not None:
+            self._start, self._end, self._energy, self._energy_rose, self._peak_power = self._resume
+            self._resume = None
+            _LOGGER.debug(f"Charging session resumed from {self._start}")
+
+        energy = snapshot.session_energy
+        completed = None
+
+        if self._start is not None:
+            energy_reset = energy is not None and self._energy is not None and energy < self._energy
+            if not plugged or (energy_reset and self._energy_rose):
+                completed = self._finish()
+            elif energy_reset:
+                _LOGGER.debug(f"Stale session energy {self._energy} Wh reset to {energy} Wh")
+                self._energy = energy
+
+        if plugged:
+            if self._start is None:
+                self._start = now
+                _LOGGER.debug(f"Charging session started at {now}")
+            if energy is not None:
+                if self._energy is not None and energy > self._energy:
+                    self._energy_rose = True
+                self._energy = energy
+            if snapshot.charge_power:
+                self._peak_power = max(self._peak_power, snapshot.charge_power)
+                self._modes[snapshot.charger_status] += 1
+            self._end = now
+
+        return completed
+
+    def _finish(self) -> dict | None:
+        """Close the current session and build its record."""
+        record = None
+        if self._energy and self._energy_rose:
+            record = {
+                "start": self._start,
+                "end": self._end,
+                "energy_kwh": round(self._energy / 1000, 3),
+                "peak_kw": round(self._peak_power / 1000, 3),
+                "mode": self._modes.most_common(1)[0][0] if self._modes else "n/a",
+            }
+            _LOGGER.debug(f"Charging session completed: {record}")
+        self._reset()
+        return record
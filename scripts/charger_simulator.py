@@ -0,0 +1,252 @@
+"""Simulated SolarEdge EV Charger (AU) fleet.
+
+Serves time-evolving ``/web/v1/status`` protobuf payloads for many virtual
+chargers from a single aiohttp server, following the field layout that
+``parse_status``/``parse_evse`` expect. Charger ``n`` is served at
+``/c/<n>/web/v1/status`` so it can be configured with the host
+``127.0.0.1:<port>/c/<n>``; charger 0 is also served at ``/web/v1/status``.
+
+Each charger follows a script of timed events (plug, start, stop, error,
+clear, unplug). Scripts are generated from a seed, or loaded from a JSON
+file mapping charger ids (or ``"*"``) to lists of ``[seconds, event]``.
+
+Usage:
+    python scripts/charger_simulator.py --chargers 200 --port 8765
+"""
+import argparse
+import json
+import random
+import struct
+import time
+
+from aiohttp import web
+
+# Enum values, see CarStatus / ChargerStatus in coordinator.py
+CAR_DISCONNECTED = 0
+CAR_CONNECTED = 1
+CAR_CHARGING = 2
+
+CHARGER_READY = 0
+CHARGER_CHARGING = 2
+CHARGER_CHARGING_EXCESS_PV = 4
+CHARGER_ERROR = 6
+
+EVENTS = ("plug", "start", "start_pv", "stop", "error", "clear", "unplug")
+
+
+def encode_varint(value: int) -> bytes:
+    """Encode an unsigned protobuf varint."""
+    out = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            out.append(byte | 0x80)
+        else:
+            out.append(byte)
+            return bytes(out)
+
+
+def encode_tag(field_number: int, wire_type: int) -> bytes:
+    return encode_varint((field_number << 3) | wire_type)
+
+
+def encode_varint_field(field_number: int, value: int) -> bytes:
+    return encode_tag(field_number, 0) + encode_varint(value)
+
+
+def encode_float_field(field_number: int, value: float) -> bytes:
+    return encode_tag(field_number, 5) + struct.pack("<f", value)
+
+
+def encode_bytes_field(field_number: int, value: bytes) -> bytes:
+    return encode_tag(field_number, 2) + encode_varint(len(value)) + value
+
+
+def encode_status(
+    inverter_sn: str,
+    car_status: int,
+    charger_status: int,
+    charge_power: float,
+    session_energy: float,
+    error_code: int,
+    subsystem: int,
+    charger_sn: str,
+) -> bytes:
+    """Build a top-level status message with an EVSE submessage (field 38)."""
+    evse = b"".join((
+        encode_varint_field(1, car_status),
+        encode_varint_field(2, charger_status),
+        encode_float_field(3, charge_power),
+        encode_float_field(4, session_energy),
+        encode_varint_field(5, error_code),
+        encode_varint_field(6, subsystem),
+        encode_bytes_field(7, charger_sn.encode("latin-1")),
+    ))
+    return b"".join((
+        encode_bytes_field(1, inverter_sn.encode("latin-1")),
+        # Unknown fields the real device sends, exercising skip_field()
+        encode_varint_field(2, 1),
+        encode_tag(10, 1) + struct.pack("<d", time.time()),
+        encode_bytes_field(38, evse),
+    ))
+
+
+def generate_script(rng: random.Random, duration: float) -> list[tuple[float, str]]:
+    """Generate a random sequence of charging sessions for one charger."""
+    script = []
+    t = rng.uniform(0, 30)
+    while t < duration:
+        script.append((t, "plug"))
+        t += rng.uniform(2, 20)
+        script.append((t, rng.choice(("start", "start", "start_pv"))))
+        t += rng.uniform(60, 600)
+        if rng.random() < 0.05:
+            script.append((t, "error"))
+            t += rng.uniform(10, 60)
+            script.append((t, "clear"))
+            t += rng.uniform(5, 30)
+        script.append((t, "stop"))
+        t += rng.uniform(5, 120)
+        script.append((t, "unplug"))
+        t += rng.uniform(10, 300)
+    return script
+
+
+class VirtualCharger:
+    """One scripted charger whose state is derived from elapsed time."""
+
+    def __init__(self, index: int, script: list[tuple[float, str]], max_power: float, ramp_seconds: float):
+        self.index = index
+        self.inverter_sn = f"7E{index:06X}"
+        self.charger_sn = f"EVSA{index:08d}"
+        self.script = sorted(script)
+        self.max_power = max_power
+        self.ramp_seconds = ramp_seconds
+        self.started = time.monotonic()
+
+    def payload(self) -> bytes:
+        """Replay the script up to now and encode the resulting state."""
+        now = time.monotonic() - self.started
+
+        car_status = CAR_DISCONNECTED
+        charger_status = CHARGER_READY
+        error_code = 0
+        charging_since = None
+        session_energy = 0.0
+
+        for at, event in self.script:
+            if at > now:
+                break
+            if charging_since is not None and event in ("stop", "error", "unplug"):
+                session_energy += self._energy(charging_since, at)
+                charging_since = None
+            if event == "plug":
+                car_status = CAR_CONNECTED
+                session_energy = 0.0
+            elif event in ("start", "start_pv") and car_status != CAR_DISCONNECTED:
+                car_status = CAR_CHARGING
+                charger_status = CHARGER_CHARGING_EXCESS_PV if event == "start_pv" else CHARGER_CHARGING
+                charging_since = at
+            elif event == "stop":
+                car_status = CAR_CONNECTED if car_status != CAR_DISCONNECTED else car_status
+                charger_status = CHARGER_READY
+            elif event == "error":
+                car_status = CAR_CONNECTED if car_status != CAR_DISCONNECTED else car_status
+                charger_status = CHARGER_ERROR
+                error_code = 4
+            elif event == "clear":
+                charger_status = CHARGER_READY
+                error_code = 0
+            elif event == "unplug":
+                car_status = CAR_DISCONNECTED
+                charger_status = CHARGER_READY
+
+        charge_power = 0.0
+        if charging_since is not None:
+            charge_power = self._power(now - charging_since)
+            session_energy += self._energy(charging_since, now)
+
+        return encode_status(
+            self.inverter_sn,
+            car_status,
+            charger_status,
+            charge_power,
+            session_energy,
+            error_code,
+            3 if error_code else 0,
+            self.charger_sn,
+        )
+
+    def _power(self, elapsed: float) -> float:
+        """Linear ramp up to max power."""
+        if elapsed >= self.ramp_seconds:
+            return self.max_power
+        return self.max_power * elapsed / self.ramp_seconds
+
+    def _energy(self, since: float, until: float) -> float:
+        """Energy in Wh delivered between two script times."""
+        elapsed = until - since
+        ramp = min(elapsed, self.ramp_seconds)
+        ramp_energy = self.max_power * ramp * ramp / (2 * self.ramp_seconds)
+        full_energy = self.max_power * max(elapsed - self.ramp_seconds, 0)
+        return (ramp_energy + full_energy) / 3600
+
+
+def build_fleet(
+    count: int,
+    seed: int = 0,
+    duration: float = 3600,
+    max_power: float = 7400,
+    ramp_seconds: float = 30,
+    script_file: str | None = None,
+) -> list[VirtualCharger]:
+    """Create ``count`` virtual chargers with generated or loaded scripts."""
+    scripts = {}
+    if script_file:
+        with open(script_file) as f:
+            scripts = json.load(f)
+
+    fleet = []
+    for index in range(count):
+        script = scripts.get(str(index), scripts.get("*"))
+        if script is None:
+            script = generate_script(random.Random(seed + index), duration)
+        else:
+            script = [(float(at), event) for at, event in script if event in EVENTS]
+        fleet.append(VirtualCharger(index, script, max_power, ramp_seconds))
+    return fleet
+
+
+def build_app(fleet: list[VirtualCharger]) -> web.Application:
+    """Create the aiohttp application serving the fleet."""
+
+    async def handle_status(request: web.Request) -> web.Response:
+        index = int(request.match_info.get("index", 0))
+        if index >= len(fleet):
+            raise web.HTTPNotFound()
+        return web.Response(body=fleet[index].payload(), content_type="application/x-protobuf")
+
+    app = web.Application()
+    app.router.add_get("/web/v1/status", handle_status)
+    app.router.add_get("/c/{index:\\d+}/web/v1/status", handle_status)
+    return app
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chargers", type=int, default=100)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--max-power", type=float, default=7400, help="Charge power in W after the ramp")
+    parser.add_argument("--ramp", type=float, default=30, help="Seconds to ramp up to max power")
+    parser.add_argument("--script", help="JSON file with per-charger event scripts")
+    args = parser.parse_args()
+
+    fleet = build_fleet(args.chargers, args.seed, max_power=args.max_power, ramp_seconds=args.ramp, script_file=args.script)
+    web.run_app(build_app(fleet), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
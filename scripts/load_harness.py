@@ -0,0 +1,214 @@
+"""Scaling harness for the SolarEdge EV Charger (AU) coordinator.
+
+Starts ``charger_simulator.py`` in a separate process (or uses one that is
+already running, see ``--simulator``), stands up one coordinator per
+virtual charger against it and reports, per step:
+
+* polls completed / failed,
+* event-loop lag (p50 / p99 / max) measured by a sleep-drift probe,
+* CPU time per poll and per charger per second,
+* memory allocated per charger (tracemalloc).
+
+Only the coordinators run in this process, so the figures exclude the
+cost of serving the simulated chargers.
+
+Steps stop early once the p99 loop lag exceeds ``--max-lag``, which gives
+the scaling limit of the integration on this machine.
+
+Requires Home Assistant to be installed. Run from the repository root:
+    python scripts/load_harness.py --chargers 50 100 200 400 --scan-interval 5
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from homeassistant.core import HomeAssistant  # noqa: E402
+from homeassistant.helpers import frame  # noqa: E402
+
+from custom_components.solaredge_ev_charger_au.coordinator import (  # noqa: E402
+    SolarEdgeEVChargerAUDataUpdateCoordinator,
+)
+
+PROBE_INTERVAL = 0.05
+
+SIMULATOR = os.path.join(os.path.dirname(__file__), "charger_simulator.py")
+
+
+async def start_simulator(args) -> asyncio.subprocess.Process:
+    """Start the simulator in its own process and wait until it accepts connections."""
+    command = [
+        sys.executable, SIMULATOR,
+        "--chargers", str(max(args.chargers)),
+        "--port", str(args.port),
+        "--seed", str(args.seed),
+    ]
+    if args.script:
+        command += ["--script", args.script]
+    process = await asyncio.create_subprocess_exec(
+        *command, stdout=asyncio.subprocess.DEVNULL, stderr=asyncio.subprocess.DEVNULL
+    )
+
+    for _ in range(100):
+        if process.returncode is not None:
+            raise RuntimeError(f"Simulator exited with code {process.returncode}")
+        try:
+            _, writer = await asyncio.open_connection("127.0.0.1", args.port)
+        except OSError:
+            await asyncio.sleep(0.1)
+            continue
+        writer.close()
+        await writer.wait_closed()
+        return process
+
+    process.terminate()
+    raise RuntimeError(f"Simulator did not start listening on port {args.port}")
+
+
+async def probe_loop_lag(samples: list[float], stop: asyncio.Event) -> None:
+    """Record how late the loop wakes up a fixed-interval sleeper."""
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        expected = loop.time() + PROBE_INTERVAL
+        await asyncio.sleep(PROBE_INTERVAL)
+        samples.append(max(loop.time() - expected, 0))
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(int(len(values) * pct / 100), len(values) - 1)]
+
+
+async def run_step(hass: HomeAssistant, base_host: str, count: int, scan_interval: int, duration: float) -> dict:
+    """Run ``count`` coordinators for ``duration`` seconds and collect metrics."""
+    tracemalloc.start()
+    mem_before = tracemalloc.get_traced_memory()[0]
+
+    coordinators = [
+        SolarEdgeEVChargerAUDataUpdateCoordinator(hass, f"{base_host}/c/{index}", scan_interval)
+        for index in range(count)
+    ]
+
+    polls = 0
+    failures = 0
+
+    # Count in the update itself: listeners are skipped when the snapshot
+    # did not change (always_update=False), so they would miss idle polls.
+    def count_updates(coordinator):
+        update = coordinator._async_update_data
+
+        async def _counted_update():
+            nonlocal polls, failures
+            try:
+                result = await update()
+            except Exception:
+                failures += 1
+                raise
+            polls += 1
+            return result
+
+        coordinator._async_update_data = _counted_update
+
+    for coordinator in coordinators:
+        count_updates(coordinator)
+
+    # Coordinators only schedule refreshes while they have a listener
+    unsubs = [coordinator.async_add_listener(lambda: None) for coordinator in coordinators]
+
+    lag_samples: list[float] = []
+    stop = asyncio.Event()
+    probe = asyncio.create_task(probe_loop_lag(lag_samples, stop))
+
+    cpu_start = time.process_time()
+    wall_start = time.monotonic()
+
+    # Spread the first refreshes over one interval like a restart would
+    for index, coordinator in enumerate(coordinators):
+        hass.loop.call_later(
+            scan_interval * index / count,
+            lambda c=coordinator: hass.async_create_task(c.async_refresh()),
+        )
+
+    await asyncio.sleep(duration)
+
+    cpu_used = time.process_time() - cpu_start
+    wall_used = time.monotonic() - wall_start
+    mem_after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    stop.set()
+    await probe
+    for unsub in unsubs:
+        unsub()
+    for coordinator in coordinators:
+        await coordinator.async_shutdown()
+
+    return {
+        "chargers": count,
+        "polls": polls,
+        "failures": failures,
+        "lag_p50_ms": percentile(lag_samples, 50) * 1000,
+        "lag_p99_ms": percentile(lag_samples, 99) * 1000,
+        "lag_max_ms": max(lag_samples, default=0) * 1000,
+        "cpu_ms_per_poll": cpu_used * 1000 / max(polls + failures, 1),
+        "cpu_pct_per_charger": 100 * cpu_used / wall_used / count,
+        "mem_kib_per_charger": (mem_after - mem_before) / 1024 / count,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--chargers", type=int, nargs="+", default=[10, 50, 100, 200])
+    parser.add_argument("--scan-interval", type=int, default=5)
+    parser.add_argument("--duration", type=float, default=30, help="Seconds per step")
+    parser.add_argument("--max-lag", type=float, default=100, help="Stop once p99 loop lag exceeds this (ms)")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--script", help="JSON file with per-charger event scripts")
+    parser.add_argument(
+        "--simulator",
+        help="host:port of an already running simulator (e.g. on another machine) instead of starting one",
+    )
+    args = parser.parse_args()
+
+    process = None
+    if args.simulator:
+        simulator_host = args.simulator
+    else:
+        process = await start_simulator(args)
+        simulator_host = f"127.0.0.1:{args.port}"
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        frame.async_setup(hass)
+
+        header = f"{'chargers':>8} {'polls':>7} {'fail':>5} {'lag p50':>8} {'lag p99':>8} {'lag max':>8} {'cpu/poll':>9} {'cpu%/chg':>9} {'KiB/chg':>8}"
+        print(header)
+        for count in args.chargers:
+            result = await run_step(hass, simulator_host, count, args.scan_interval, args.duration)
+            print(
+                f"{result['chargers']:>8} {result['polls']:>7} {result['failures']:>5} "
+                f"{result['lag_p50_ms']:>6.1f}ms {result['lag_p99_ms']:>6.1f}ms {result['lag_max_ms']:>6.1f}ms "
+                f"{result['cpu_ms_per_poll']:>7.2f}ms {result['cpu_pct_per_charger']:>8.3f}% "
+                f"{result['mem_kib_per_charger']:>8.1f}"
+            )
+            if result["lag_p99_ms"] > args.max_lag:
+                print(f"Scaling limit reached: p99 loop lag above {args.max_lag} ms at {count} chargers")
+                break
+
+        await hass.async_stop(force=True)
+
+    if process is not None:
+        process.terminate()
+        await process.wait()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
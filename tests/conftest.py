@@ -0,0 +1,19 @@
+"""Import the integration's Home Assistant independent modules directly.
+
+The package ``__init__`` imports Home Assistant, so it is replaced with a
+bare package here; the modules under test only need ``const``.
+"""
+import sys
+import types
+from pathlib import Path
+
+_ROOT = Path(__file__).resolve().parent.parent
+
+for _name, _path in (
+    ("custom_components", _ROOT / "custom_components"),
+    ("custom_components.solaredge_ev_charger_au", _ROOT / "custom_components" / "solaredge_ev_charger_au"),
+):
+    if _name not in sys.modules:
+        _package = types.ModuleType(_name)
+        _package.__path__ = [str(_path)]
+        sys.modules[_name] = _package
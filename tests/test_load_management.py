@@ -0,0 +1,150 @@
+"""Tests for the excess-PV load management controller."""
+import math
+
+from custom_components.solaredge_ev_charger_au.load_management import LoadManagementController
+
+VOLTAGE = 230
+
+
+def power_for(current: float) -> float:
+    return current * VOLTAGE
+
+
+class SimulatedSite:
+    """A charger that follows the target current at a PV site.
+
+    The charger applies a new target one poll later, and the grid meter
+    lags the charger by one poll, like a separate energy meter sensor.
+    Grid power is positive when importing.
+    """
+
+    def __init__(self, controller: LoadManagementController, house_load: float = 500):
+        self.controller = controller
+        self.house_load = house_load
+        self.charge_power = 0.0
+        self._metered_charge_power = 0.0
+        self.targets: list[float] = []
+
+    def step(self, pv_power: float) -> float:
+        grid_power = self.house_load + self._metered_charge_power - pv_power
+        target = self.controller.update(self.charge_power, grid_power)
+        self.targets.append(target)
+
+        self._metered_charge_power = self.charge_power
+        self.charge_power = power_for(target)
+        return target
+
+    def run(self, pv_profile) -> list[float]:
+        start = len(self.targets)
+        for pv_power in pv_profile:
+            self.step(pv_power)
+        return self.targets[start:]
+
+
+def changes(targets: list[float]) -> int:
+    return sum(1 for previous, current in zip(targets, targets[1:]) if previous != current)
+
+
+def test_does_not_start_below_minimum_plus_hysteresis():
+    controller = LoadManagementController(32)
+    # 7 A of surplus is above the 6 A minimum but inside the hysteresis band
+    assert controller.update(0, -power_for(7)) == 0
+
+
+def test_starts_with_floored_current_above_threshold():
+    controller = LoadManagementController(32)
+    assert controller.update(0, -power_for(10.7)) == 10
+
+
+def test_target_is_capped_at_max_current():
+    controller = LoadManagementController(16)
+    assert controller.update(0, -power_for(40)) == 16
+
+
+def test_keeps_charging_at_minimum_inside_stop_band():
+    controller = LoadManagementController(32, settle_polls=0)
+    controller.update(0, -power_for(10))
+    # Only 5 A of surplus: below the minimum but above the stop threshold
+    assert controller.update(power_for(10), power_for(5)) == 6
+
+
+def test_stops_below_minimum_minus_hysteresis():
+    controller = LoadManagementController(32, settle_polls=0)
+    controller.update(0, -power_for(10))
+    assert controller.update(power_for(10), power_for(6)) == 0
+
+
+def test_ignores_changes_smaller_than_hysteresis():
+    controller = LoadManagementController(32, settle_polls=0)
+    controller.update(0, -power_for(12))
+    assert controller.update(power_for(12), -power_for(1)) == 12
+    assert controller.update(power_for(12), power_for(1)) == 12
+    assert controller.update(power_for(12), -power_for(2)) == 14
+
+
+def test_missing_grid_power_keeps_target():
+    controller = LoadManagementController(32, settle_polls=0)
+    controller.update(0, -power_for(10))
+    assert controller.update(power_for(10), None) == 10
+
+
+def test_three_phase_splits_surplus_across_phases():
+    controller = LoadManagementController(32, phases=3)
+    assert controller.update(0, -3 * power_for(10)) == 10
+
+
+def test_holds_new_target_while_charger_settles():
+    controller = LoadManagementController(32, settle_polls=1)
+    assert controller.update(0, -power_for(10)) == 10
+    # The grid meter has not seen the new load yet, so the surplus looks huge
+    assert controller.update(power_for(10), -power_for(10)) == 10
+    assert controller.update(power_for(10), 0) == 10
+
+
+def test_reset_clears_target():
+    controller = LoadManagementController(32)
+    controller.update(0, -power_for(10))
+    controller.reset()
+    assert controller.target_current == 0
+
+
+def test_closed_loop_settles_on_steady_pv():
+    site = SimulatedSite(LoadManagementController(32))
+    targets = site.run([4000] * 60)
+
+    expected = math.floor((4000 - site.house_load) / VOLTAGE)
+    # The metered grid power lags one poll, so allow a short transient
+    assert targets[-1] == expected
+    assert all(target == expected for target in targets[3:])
+    assert changes(targets) <= 3
+
+
+def test_closed_loop_follows_pv_steps_within_a_few_polls():
+    site = SimulatedSite(LoadManagementController(32))
+    site.run([4000] * 20)
+
+    targets = site.run([2000] * 20)
+    assert targets[-1] == math.floor((2000 - site.house_load) / VOLTAGE)
+    assert all(target == targets[-1] for target in targets[3:])
+
+    # Surplus well below the stop threshold: charging stops and stays off
+    targets = site.run([1000] * 20)
+    assert all(target == 0 for target in targets[3:])
+
+
+def test_closed_loop_does_not_hunt_on_noisy_pv():
+    site = SimulatedSite(LoadManagementController(32))
+    # +/- 150 W of cloud noise around 5 kW, roughly +/- 0.65 A
+    profile = [5000 + 150 * math.sin(step * 1.7) for step in range(200)]
+    targets = site.run(profile)
+
+    assert changes(targets[5:]) == 0
+
+
+def test_closed_loop_does_not_toggle_around_start_threshold():
+    site = SimulatedSite(LoadManagementController(32))
+    # Surplus oscillates between 6.5 A and 7.3 A, inside the start band
+    profile = [site.house_load + power_for(6.9 + 0.4 * math.sin(step)) for step in range(100)]
+    targets = site.run(profile)
+
+    assert all(target == 0 for target in targets)
@@ -0,0 +1,98 @@
+"""Tests for charging session boundary detection."""
+from types import SimpleNamespace
+
+from custom_components.solaredge_ev_charger_au.session_tracker import SessionTracker
+
+
+def snapshot(car_status: str, charge_power: float, session_energy: float, charger_status: str = "active"):
+    return SimpleNamespace(
+        car_status=car_status,
+        charger_status=charger_status,
+        charge_power=charge_power,
+        session_energy=session_energy,
+    )
+
+
+def feed(tracker: SessionTracker, readings, start: float = 0) -> list[dict]:
+    records = []
+    for offset, reading in enumerate(readings):
+        record = tracker.update(snapshot(*reading), start + offset)
+        if record is not None:
+            records.append(record)
+    return records
+
+
+def test_records_session_on_unplug():
+    records = feed(SessionTracker(), [
+        ("connected", 0, 0),
+        ("charging", 7000, 2500),
+        ("connected", 0, 5000),
+        ("disconnected", 0, 5000),
+    ])
+    assert records == [
+        {"start": 0, "end": 2, "energy_kwh": 5.0, "peak_kw": 7.0, "mode": "active"},
+    ]
+
+
+def test_stale_counter_at_plug_in_is_not_recorded_again():
+    tracker = SessionTracker()
+    feed(tracker, [("connected", 0, 0), ("charging", 7000, 5000), ("disconnected", 0, 5000)])
+
+    # Replugged while the previous session's 5000 Wh is still shown
+    records = feed(tracker, [
+        ("connected", 0, 5000),
+        ("charging", 7000, 200),
+        ("charging", 7000, 900),
+        ("disconnected", 0, 900),
+    ], start=10)
+    assert [record["energy_kwh"] for record in records] == [0.9]
+
+
+def test_plug_and_unplug_with_stale_counter_records_nothing():
+    records = feed(SessionTracker(), [("connected", 0, 5000), ("disconnected", 0, 5000)])
+    assert records == []
+
+
+def test_counter_reset_after_rising_starts_a_new_session():
+    records = feed(SessionTracker(), [
+        ("connected", 0, 0),
+        ("charging", 7000, 3000),
+        ("charging", 7000, 100),
+        ("charging", 7000, 800),
+        ("disconnected", 0, 800),
+    ])
+    assert [record["energy_kwh"] for record in records] == [3.0, 0.8]
+
+
+def test_unknown_status_is_ignored():
+    tracker = SessionTracker()
+    feed(tracker, [("connected", 0, 0), ("charging", 7000, 1000)])
+    assert feed(tracker, [("n/a", None, None)]) == []
+    assert tracker.state is not None
+
+
+def test_open_session_resumes_from_state():
+    tracker = SessionTracker()
+    feed(tracker, [("connected", 0, 0), ("charging", 7000, 3000)])
+
+    resumed = SessionTracker(tracker.state)
+    records = feed(resumed, [("connected", 0, 3000), ("disconnected", 0, 3000)], start=10)
+    assert records[0]["start"] == 0
+    assert records[0]["energy_kwh"] == 3.0
+    assert resumed.state is None
+
+
+def test_resumed_session_is_recorded_if_unplugged_meanwhile():
+    resumed = SessionTracker((0, 5, 3000, True, 7000))
+    records = feed(resumed, [("disconnected", 0, 3000)], start=10)
+    assert records == [
+        {"start": 0, "end": 5, "energy_kwh": 3.0, "peak_kw": 7.0, "mode": "n/a"},
+    ]
+    assert resumed.state is None
+
+
+def test_counter_reset_while_not_tracked_closes_resumed_session():
+    resumed = SessionTracker((0, 5, 3000, True, 7000))
+    records = feed(resumed, [("charging", 7000, 200)], start=10)
+    assert [(record["end"], record["energy_kwh"]) for record in records] == [(5, 3.0)]
+    assert resumed.state[0] == 10